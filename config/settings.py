@@ -20,7 +20,8 @@ class Settings:
     MAX_FILE_SIZE_MB = 500
     CHUNK_SIZE = 10000  # For processing large files in chunks
     MAX_WORKERS = 4  # For parallel processing
-    
+    JOB_WORKERS = int(os.getenv('JOB_WORKERS', '2'))  # Background job processes
+
     # Supported formats
     SUPPORTED_IMAGE_FORMATS = ['.jpg', '.jpeg', '.png', '.bmp', '.tiff']
     SUPPORTED_TABULAR_FORMATS = ['.csv', '.xlsx', '.xls', '.json', '.parquet']
@@ -41,7 +42,18 @@ class Settings:
     if _raw_db_url.startswith('postgres://'):
         _raw_db_url = _raw_db_url.replace('postgres://', 'postgresql://', 1)
     DATABASE_URL = _raw_db_url
-    
+
+    # Connection pool knobs (ignored for SQLite, which uses StaticPool).
+    # pool_size: connections kept open; max_overflow: extra under burst;
+    # pool_recycle: seconds before a connection is replaced, to stay
+    # under server/LB idle timeouts
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '20'))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '40'))
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))
+
+    # Cache (optional - client lookups fall back to the DB when unset)
+    REDIS_URL = os.getenv('REDIS_URL')
+
     # Logging
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
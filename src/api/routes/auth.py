@@ -12,7 +12,7 @@ import hashlib
 import base64
 from config.settings import settings
 from src.utils.email import send_access_email
-from src.database.crud.client_crud import get_client_by_email, generate_api_key
+from src.database.crud.client_crud import get_client_by_email, generate_api_key, hash_api_key
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -30,6 +30,7 @@ async def create_guest_session(db: Session = Depends(get_db)):
         email=f"{guest_id}@temp.local",
         company="Guest Session",
         api_key=api_key,
+        api_key_hash=hash_api_key(api_key),
         plan_type="guest",
         monthly_quota_mb=50,
         expires_at=datetime.utcnow() + timedelta(hours=24)
@@ -37,7 +38,6 @@ async def create_guest_session(db: Session = Depends(get_db)):
     
     db.add(new_guest)
     db.commit()
-    db.refresh(new_guest)
     
     return {
         "api_key": new_guest.api_key,
@@ -60,12 +60,12 @@ async def request_access(email: str, db: Session = Depends(get_db)):
             name=email.split("@")[0],
             email=email,
             api_key=api_key,
+            api_key_hash=hash_api_key(api_key),
             plan_type="free",
             monthly_quota_mb=1000
         )
         db.add(client)
         db.commit()
-        db.refresh(client)
     
     one_hour_ago = datetime.utcnow() - timedelta(hours=1)
     recent_count = db.query(AccessToken).filter(AccessToken.email == email, AccessToken.created_at >= one_hour_ago).count()
@@ -121,13 +121,13 @@ async def register_client(email: str, name: str, company: str = None, db: Sessio
         email=email,
         company=company or "Independent",
         api_key=api_key,
+        api_key_hash=hash_api_key(api_key),
         plan_type="free",
         monthly_quota_mb=1000  # 1GB for free tier
     )
     
     db.add(new_client)
     db.commit()
-    db.refresh(new_client)
     
     return {
         "client_id": new_client.id,
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends
 from fastapi.responses import FileResponse, StreamingResponse
 from typing import List, Optional
 import io
@@ -83,7 +83,7 @@ async def chat_with_data(
     Chat with your dataset (Requires Authentication)
     """
     try:
-        job = job_manager.get_job(job_id, db)
+        job = job_manager.get_job(job_id, db=db)
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
         
@@ -129,19 +129,10 @@ async def chat_with_data(
         logger.error(f"Chat error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-def process_job_in_background(job_id: str):
-    """Background task to process a job"""
-    try:
-        job_manager.execute_job(job_id)
-        logger.info(f"Background processing completed for job {job_id}")
-    except Exception as e:
-        logger.error(f"Background processing failed for job {job_id}: {e}")
-
 @router.post("/create", response_model=JobResponse)
 async def create_job(
     data_type: DataType = Query(..., description="Data type"),
     input_path: str = Query(..., description="Path to input file/directory"),
-    background_tasks: BackgroundTasks = None,
     remove_duplicates: bool = Query(True, description="Remove duplicate records"),
     handle_missing_values: bool = Query(True, description="Handle missing values"),
     missing_value_strategy: str = Query("mean", description="Strategy for missing values"),
@@ -219,9 +210,11 @@ async def create_job(
         )
         
         
-        if auto_execute and background_tasks:
-            background_tasks.add_task(process_job_in_background, job.job_id)
-            logger.info(f"Job {job.job_id} queued for background processing")
+        if auto_execute:
+            # Worker pool, not BackgroundTasks: the pipeline is CPU-bound
+            # and would otherwise run inside the API process
+            job_manager.submit_job(job.job_id, db=db)
+            logger.info(f"Job {job.job_id} submitted to worker pool")
         
         dt = job.data_type.value if hasattr(job.data_type, "value") else job.data_type
         st = job.status.value if hasattr(job.status, "value") else job.status
@@ -255,14 +248,14 @@ async def execute_job(
     - **job_id**: Unique job identifier
     """
     try:
-        job = job_manager.get_job(job_id, db)
+        job = job_manager.get_job(job_id, db=db)
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
         
         if job.client_id != client.id:
             raise HTTPException(status_code=403, detail="Access denied to this job")
         
-        job = job_manager.execute_job(job_id, db)
+        job = job_manager.execute_job(job_id, db=db)
         
         quality_metrics = None
         if job.quality_metrics:
@@ -300,7 +293,7 @@ async def get_job_preview(
     Get job preview data (Requires Authentication)
     """
     try:
-        job = job_manager.get_job(job_id, db)
+        job = job_manager.get_job(job_id, db=db)
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
         
@@ -398,7 +391,7 @@ async def get_job(
     - **job_id**: Unique job identifier
     """
     try:
-        job = job_manager.get_job(job_id, db)
+        job = job_manager.get_job(job_id, db=db)
         
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
@@ -478,7 +471,7 @@ async def get_job_status(
     - **job_id**: Unique job identifier
     """
     try:
-        job = job_manager.get_job(job_id, db)
+        job = job_manager.get_job(job_id, db=db)
         
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
@@ -486,7 +479,7 @@ async def get_job_status(
         if job.client_id != client.id:
             raise HTTPException(status_code=403, detail="Access denied to this job")
         
-        status = job_manager.get_job_status(job_id, db)
+        status = job_manager.get_job_status(job_id, db=db)
         
         if 'error' in status:
             raise HTTPException(status_code=404, detail=status['error'])
@@ -513,7 +506,7 @@ async def cancel_job(
     - **job_id**: Unique job identifier
     """
     try:
-        job = job_manager.get_job(job_id, db)
+        job = job_manager.get_job(job_id, db=db)
         
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
@@ -523,7 +516,7 @@ async def cancel_job(
             raise HTTPException(status_code=403, detail="Access denied to this job")
         
         # Cancel the job
-        success = job_manager.cancel_job(job_id, db)
+        success = job_manager.cancel_job(job_id, db=db)
         
         if not success:
             raise HTTPException(
@@ -532,7 +525,7 @@ async def cancel_job(
             )
         
         # Get updated job
-        job = job_manager.get_job(job_id, db)
+        job = job_manager.get_job(job_id, db=db)
         
         quality_metrics = None
         if job and job.quality_metrics:
@@ -571,7 +564,7 @@ async def download_processed_file(
     - **job_id**: Unique job identifier
     """
     try:
-        job = job_manager.get_job(job_id, db)
+        job = job_manager.get_job(job_id, db=db)
         
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
@@ -614,7 +607,7 @@ async def get_job_report(
     Get job quality report in JSON or PDF format (Requires Authentication)
     """
     try:
-        job = job_manager.get_job(job_id, db)
+        job = job_manager.get_job(job_id, db=db)
         
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
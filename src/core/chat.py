@@ -1,57 +1,83 @@
 import pandas as pd
+import numpy as np
 import re
 from typing import Dict, Any, List, Optional
 from src.core.models import ProcessingJob
 
 class DataChatEngine:
+    # One compiled alternation so intent detection is a single regex scan
+    # over the query instead of a substring check per keyword
+    _INTENT_RE = re.compile(
+        r"(?P<rows>how many rows|row count|total rows|size)"
+        r"|(?P<cols>how many columns|column count|total columns|features)"
+        r"|(?P<missing>missing|null)"
+        r"|(?P<duplicates>duplicate)"
+        r"|(?P<outliers>outlier)"
+    )
+
     def __init__(self):
         pass
 
+    def _answer_rows(self, query: str, df: pd.DataFrame) -> str:
+        return f"The dataset has {len(df):,} rows."
+
+    def _answer_cols(self, query: str, df: pd.DataFrame) -> str:
+        return f"The dataset has {len(df.columns)} columns: {', '.join(df.columns[:5])}{'...' if len(df.columns)>5 else ''}."
+
+    def _answer_missing(self, query: str, df: pd.DataFrame) -> str:
+        total_missing = df.isnull().sum().sum()
+        if 'column' in query or 'breakdown' in query:
+            missing_by_col = df.isnull().sum()
+            missing_cols = missing_by_col[missing_by_col > 0]
+            if missing_cols.empty:
+                return "There are no missing values in any column."
+            details = ", ".join([f"{col}: {val}" for col, val in missing_cols.items()])
+            return f"Missing values by column: {details}."
+        return f"There are {total_missing} missing values in total across the dataset."
+
+    def _answer_duplicates(self, query: str, df: pd.DataFrame) -> str:
+        # Hash each row once instead of comparing every column pair-wise
+        h = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        dupes = len(h) - len(np.unique(h))
+        return f"There are {dupes} duplicate rows found."
+
+    def _answer_outliers(self, query: str, df: pd.DataFrame) -> str:
+        numeric_cols = df.select_dtypes(include=['number']).columns
+        outlier_info = []
+        for col in numeric_cols:
+            # NaN-aware stats on the raw ndarray avoid the dropna() copy
+            arr = df[col].to_numpy(dtype=np.float64)
+            if np.isnan(arr).all():
+                continue
+            std = np.nanstd(arr, ddof=1)
+            if std > 0:
+                z_scores = np.abs((arr - np.nanmean(arr)) / std)
+                outliers = int(np.nansum(z_scores > 3))
+                if outliers > 0:
+                    outlier_info.append(f"{col}: {outliers}")
+
+        if not outlier_info:
+            return "No statistical outliers (Z-score > 3) detected in numeric columns."
+        return f"Outliers detected: {', '.join(outlier_info)}."
+
+    _INTENT_HANDLERS = {
+        'rows': _answer_rows,
+        'cols': _answer_cols,
+        'missing': _answer_missing,
+        'duplicates': _answer_duplicates,
+        'outliers': _answer_outliers,
+    }
+
     def process_query(self, query: str, df: pd.DataFrame, job_info: ProcessingJob) -> str:
         """
         Process a natural language query against the dataframe and job info.
         """
         query = query.lower()
-        
-        # 1. General Stats
-        if any(w in query for w in ['how many rows', 'row count', 'total rows', 'size']):
-            return f"The dataset has {len(df):,} rows."
-        
-        if any(w in query for w in ['how many columns', 'column count', 'total columns', 'features']):
-            return f"The dataset has {len(df.columns)} columns: {', '.join(df.columns[:5])}{'...' if len(df.columns)>5 else ''}."
-        
-        # 2. Missing Values
-        if 'missing' in query or 'null' in query:
-            total_missing = df.isnull().sum().sum()
-            if 'column' in query or 'breakdown' in query:
-                missing_by_col = df.isnull().sum()
-                missing_cols = missing_by_col[missing_by_col > 0]
-                if missing_cols.empty:
-                    return "There are no missing values in any column."
-                details = ", ".join([f"{col}: {val}" for col, val in missing_cols.items()])
-                return f"Missing values by column: {details}."
-            return f"There are {total_missing} missing values in total across the dataset."
-
-        # 3. Duplicates
-        if 'duplicate' in query:
-            dupes = df.duplicated().sum()
-            return f"There are {dupes} duplicate rows found."
 
-        # 4. Outliers (if numeric columns exist)
-        if 'outlier' in query:
-            numeric_cols = df.select_dtypes(include=['number']).columns
-            outlier_info = []
-            for col in numeric_cols:
-                col_data = df[col].dropna()
-                if len(col_data) > 0:
-                    z_scores = ((col_data - col_data.mean()) / col_data.std()).abs()
-                    outliers = (z_scores > 3).sum()
-                    if outliers > 0:
-                        outlier_info.append(f"{col}: {outliers}")
-            
-            if not outlier_info:
-                return "No statistical outliers (Z-score > 3) detected in numeric columns."
-            return f"Outliers detected: {', '.join(outlier_info)}."
+        # 1-4. General stats, missing values, duplicates, outliers
+        match = self._INTENT_RE.search(query)
+        if match:
+            return self._INTENT_HANDLERS[match.lastgroup](self, query, df)
 
         # 5. Column Specific Stats (Mean, Max, Min)
         # Regex to find column names in query
@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import Optional, Dict, Any, List
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
 
 class DataType(str, Enum):
     """Supported data types"""
@@ -13,6 +13,7 @@ class DataType(str, Enum):
 class ProcessingStatus(str, Enum):
     """Processing status"""
     PENDING = "pending"
+    QUEUED = "queued"
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
@@ -75,3 +76,16 @@ class ProcessingConfig(BaseModel):
     parse_dates: bool = False
     encoding_strategy: str = "none"  # none, onehot, label
     custom_rules: Dict[str, Any] = {}
+    backend: str = "pandas"  # pandas, polars, dask
+
+    _dumped: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """model_dump() memoized per instance.
+
+        Configs are built once per submission and never mutated, so the
+        schema walk only has to happen the first time.
+        """
+        if self._dumped is None:
+            self._dumped = self.model_dump()
+        return self._dumped
@@ -6,13 +6,47 @@ from io import BytesIO
 from datetime import datetime
 from src.core.models import ProcessingJob, QualityMetrics
 
+def _build_stylesheet():
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(name='CustomTitle', parent=styles['Title'], fontSize=24, spaceAfter=30))
+    styles.add(ParagraphStyle(name='SectionHeader', parent=styles['Heading2'], fontSize=16, spaceBefore=20, spaceAfter=10, textColor=colors.HexColor('#4F46E5')))
+    styles.add(ParagraphStyle(name='MetricLabel', parent=styles['Normal'], fontSize=10, textColor=colors.gray))
+    styles.add(ParagraphStyle(name='MetricValue', parent=styles['Normal'], fontSize=12, fontName='Helvetica-Bold'))
+    return styles
+
+# Stylesheet and table styles are immutable across reports - build them
+# once at import instead of per generate_pdf call
+_STYLESHEET = _build_stylesheet()
+
 class ReportGenerator:
+    _STYLES = _STYLESHEET
+
+    _SCORE_STYLES = {
+        color: ParagraphStyle('Score', parent=_STYLESHEET['Normal'], fontSize=14, textColor=color)
+        for color in (colors.green, colors.orange, colors.red)
+    }
+
+    _METRICS_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (1, 0), colors.HexColor('#F3F4F6')),
+        ('TEXTCOLOR', (0, 0), (1, 0), colors.HexColor('#374151')),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (1, 0), 'Helvetica-Bold'),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB')),
+        ('PADDING', (0, 0), (-1, -1), 8),
+    ])
+
+    _COLUMNS_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#F3F4F6')),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB')),
+        ('PADDING', (0, 0), (-1, -1), 6),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ])
+
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self.styles.add(ParagraphStyle(name='CustomTitle', parent=self.styles['Title'], fontSize=24, spaceAfter=30))
-        self.styles.add(ParagraphStyle(name='SectionHeader', parent=self.styles['Heading2'], fontSize=16, spaceBefore=20, spaceAfter=10, textColor=colors.HexColor('#4F46E5')))
-        self.styles.add(ParagraphStyle(name='MetricLabel', parent=self.styles['Normal'], fontSize=10, textColor=colors.gray))
-        self.styles.add(ParagraphStyle(name='MetricValue', parent=self.styles['Normal'], fontSize=12, fontName='Helvetica-Bold'))
+        self.styles = self._STYLES
 
     def generate_pdf(self, job: ProcessingJob) -> bytes:
         buffer = BytesIO()
@@ -39,8 +73,8 @@ class ReportGenerator:
         
         # Quality Score
         score_color = colors.green if metrics.quality_score > 0.8 else (colors.orange if metrics.quality_score > 0.5 else colors.red)
-        story.append(Paragraph(f"Quality Score: <b>{metrics.quality_score * 100:.1f}%</b>", 
-                             ParagraphStyle('Score', parent=self.styles['Normal'], fontSize=14, textColor=score_color)))
+        story.append(Paragraph(f"Quality Score: <b>{metrics.quality_score * 100:.1f}%</b>",
+                             self._SCORE_STYLES[score_color]))
         story.append(Spacer(1, 10))
 
         # Key Metrics Table
@@ -53,16 +87,7 @@ class ReportGenerator:
         ]
         
         t = Table(data, colWidths=[200, 100])
-        t.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (1, 0), colors.HexColor('#F3F4F6')),
-            ('TEXTCOLOR', (0, 0), (1, 0), colors.HexColor('#374151')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (1, 0), 'Helvetica-Bold'),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB')),
-            ('PADDING', (0, 0), (-1, -1), 8),
-        ]))
+        t.setStyle(self._METRICS_TABLE_STYLE)
         story.append(t)
         story.append(Spacer(1, 20))
 
@@ -92,13 +117,7 @@ class ReportGenerator:
                 col_data.append(["...", "...", "...", "..."])
 
             t2 = Table(col_data, colWidths=[150, 80, 80, 80])
-            t2.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#F3F4F6')),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E5E7EB')),
-                ('PADDING', (0, 0), (-1, -1), 6),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ]))
+            t2.setStyle(self._COLUMNS_TABLE_STYLE)
             story.append(t2)
 
         doc.build(story)
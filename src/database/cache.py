@@ -0,0 +1,183 @@
+import json
+from datetime import datetime
+from typing import Optional
+
+from config.settings import settings
+from src.database.models import Client
+from src.utils.logger import get_logger
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+logger = get_logger("cache")
+
+# Short TTL: auth reads are hot but client rows change rarely, and 60s
+# bounds how long a revoked key can keep working
+CLIENT_CACHE_TTL_SECONDS = 60
+
+# Quota counters are re-seeded from the DB on miss, so the TTL just
+# bounds drift if an increment is ever lost
+QUOTA_CACHE_TTL_SECONDS = 60
+
+# Monthly usage summaries: dashboards poll these, new usage invalidates
+USAGE_SUMMARY_TTL_SECONDS = 60
+
+_redis = None
+if redis is not None and settings.REDIS_URL:
+    try:
+        _redis = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        _redis.ping()
+        logger.info("Redis client cache enabled")
+    except Exception as e:
+        logger.warning(f"Redis unavailable, client caching disabled: {e}")
+        _redis = None
+
+_DATETIME_FIELDS = ("created_at", "updated_at", "expires_at")
+_CLIENT_FIELDS = (
+    "id", "name", "email", "company", "api_key", "is_active",
+    "created_at", "updated_at", "plan_type", "monthly_quota_mb",
+    "used_quota_mb", "expires_at",
+)
+
+
+def cache_enabled() -> bool:
+    """Whether a reachable Redis was configured via REDIS_URL"""
+    return _redis is not None
+
+
+def _apikey_cache_key(api_key: str) -> str:
+    return f"client:apikey:{api_key}"
+
+
+def _serialize_client(client: Client) -> str:
+    data = {field: getattr(client, field) for field in _CLIENT_FIELDS}
+    for field in _DATETIME_FIELDS:
+        if data[field] is not None:
+            data[field] = data[field].isoformat()
+    return json.dumps(data)
+
+
+def _deserialize_client(raw: str) -> Client:
+    data = json.loads(raw)
+    for field in _DATETIME_FIELDS:
+        if data[field] is not None:
+            data[field] = datetime.fromisoformat(data[field])
+    # Detached instance: fine for auth checks, which only read columns
+    return Client(**data)
+
+
+def get_cached_client(api_key: str) -> Optional[Client]:
+    """Return a cached Client for this api_key, or None on miss/disabled"""
+    if _redis is None:
+        return None
+    try:
+        raw = _redis.get(_apikey_cache_key(api_key))
+    except Exception as e:
+        logger.warning(f"Redis read failed, falling back to DB: {e}")
+        return None
+    return _deserialize_client(raw) if raw else None
+
+
+def cache_client(client: Client) -> None:
+    """Store a client row under its api_key with a short TTL"""
+    if _redis is None:
+        return
+    try:
+        _redis.setex(
+            _apikey_cache_key(client.api_key),
+            CLIENT_CACHE_TTL_SECONDS,
+            _serialize_client(client),
+        )
+    except Exception as e:
+        logger.warning(f"Redis write failed: {e}")
+
+
+def invalidate_client(client: Client) -> None:
+    """Drop the cached row after an update or delete"""
+    if _redis is None:
+        return
+    try:
+        _redis.delete(_apikey_cache_key(client.api_key))
+    except Exception as e:
+        logger.warning(f"Redis invalidation failed: {e}")
+
+
+def _quota_cache_key(client_id: str) -> str:
+    return f"client:quota:{client_id}"
+
+
+def get_quota(client_id: str) -> Optional[float]:
+    """Return the cached used-quota counter, or None on miss/disabled"""
+    if _redis is None:
+        return None
+    try:
+        raw = _redis.get(_quota_cache_key(client_id))
+    except Exception as e:
+        logger.warning(f"Redis read failed, falling back to DB: {e}")
+        return None
+    return float(raw) if raw is not None else None
+
+
+def seed_quota(client_id: str, used_mb: float) -> None:
+    """Seed the counter from the DB value after a cache miss"""
+    if _redis is None:
+        return
+    try:
+        _redis.setex(_quota_cache_key(client_id), QUOTA_CACHE_TTL_SECONDS, used_mb)
+    except Exception as e:
+        logger.warning(f"Redis write failed: {e}")
+
+
+def _usage_summary_key(client_id: str, period: str) -> str:
+    return f"usage:summary:{client_id}:{period}"
+
+
+def get_usage_summary(client_id: str, period: str) -> Optional[dict]:
+    """Return the cached monthly summary dict, or None on miss/disabled"""
+    if _redis is None:
+        return None
+    try:
+        raw = _redis.get(_usage_summary_key(client_id, period))
+    except Exception as e:
+        logger.warning(f"Redis read failed, falling back to DB: {e}")
+        return None
+    return json.loads(raw) if raw else None
+
+
+def cache_usage_summary(client_id: str, period: str, summary: dict) -> None:
+    """Store a computed monthly summary with a short TTL"""
+    if _redis is None:
+        return
+    try:
+        _redis.setex(
+            _usage_summary_key(client_id, period),
+            USAGE_SUMMARY_TTL_SECONDS,
+            json.dumps(summary),
+        )
+    except Exception as e:
+        logger.warning(f"Redis write failed: {e}")
+
+
+def invalidate_usage_summary(client_id: str, period: str) -> None:
+    """Drop the cached summary after new usage lands"""
+    if _redis is None:
+        return
+    try:
+        _redis.delete(_usage_summary_key(client_id, period))
+    except Exception as e:
+        logger.warning(f"Redis invalidation failed: {e}")
+
+
+def incr_quota(client_id: str, mb_used: float) -> None:
+    """Bump an existing counter atomically; absent counters stay absent
+    so the next read re-seeds from the DB instead of starting at zero"""
+    if _redis is None:
+        return
+    try:
+        key = _quota_cache_key(client_id)
+        if _redis.exists(key):
+            _redis.incrbyfloat(key, mb_used)
+    except Exception as e:
+        logger.warning(f"Redis write failed: {e}")
@@ -5,13 +5,13 @@ from src.database.crud.client_crud import (
 )
 
 from src.database.crud.job_crud import (
-    create_job, get_job, list_jobs, update_job_status,
-    add_quality_metrics, get_job_with_metrics, delete_job,
-    get_client_job_count, get_client_completed_jobs
+    create_job, create_jobs_bulk, get_job, list_jobs, update_job_status,
+    try_cancel_job, add_quality_metrics, get_job_with_metrics, delete_job,
+    get_job_status_row, get_client_job_count, get_client_completed_jobs
 )
 
 from src.database.crud.usage_crud import (
-    log_usage, get_client_usage, get_monthly_usage_summary
+    log_usage, log_usage_many, get_client_usage, get_monthly_usage_summary
 )
 
 __all__ = [
@@ -21,10 +21,10 @@ __all__ = [
     'check_quota', 'reset_monthly_quota',
     
     # Job operations
-    'create_job', 'get_job', 'list_jobs', 'update_job_status',
-    'add_quality_metrics', 'get_job_with_metrics', 'delete_job',
-    'get_client_job_count', 'get_client_completed_jobs',
+    'create_job', 'create_jobs_bulk', 'get_job', 'list_jobs', 'update_job_status',
+    'try_cancel_job', 'add_quality_metrics', 'get_job_with_metrics', 'delete_job',
+    'get_job_status_row', 'get_client_job_count', 'get_client_completed_jobs',
     
     # Usage operations
-    'log_usage', 'get_client_usage', 'get_monthly_usage_summary'
+    'log_usage', 'log_usage_many', 'get_client_usage', 'get_monthly_usage_summary'
 ]
\ No newline at end of file
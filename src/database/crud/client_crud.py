@@ -1,19 +1,43 @@
+from sqlalchemy import tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional, List, Tuple
+import hashlib
 import secrets
-import string
+import time
 from datetime import datetime
 
 from src.database.models import Client
 # APIKey model exists but is not currently used - reserved for future multi-key feature
+from src.database import cache
 from src.utils.logger import get_logger
 
 logger = get_logger("client_crud")
 
+# Single source of truth for plan quotas (MB per month)
+PLAN_QUOTAS_MB = {
+    "free": 1000,      # 1 GB
+    "basic": 10000,    # 10 GB
+    "premium": 100000  # 100 GB
+}
+DEFAULT_QUOTA_MB = PLAN_QUOTAS_MB["free"]
+
+# Per-process quota snapshot: client_id -> (used_mb, limit_mb, cached_at).
+# check_quota answers from here while the entry is fresh and clearly
+# under the limit; anything stale or near-limit re-reads the DB, so the
+# worst a stale entry can do is one admitted job per TTL window
+QUOTA_CHECK_TTL_SECONDS = 5.0
+_quota_cache: dict = {}
+
 def generate_api_key(length: int = 32) -> str:
     """Generate a secure random API key"""
-    alphabet = string.ascii_letters + string.digits
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    # One RNG read + base64 instead of a secrets.choice call per char;
+    # token_urlsafe yields ~4 chars per 3 bytes
+    return secrets.token_urlsafe(length * 3 // 4)[:length]
+
+def hash_api_key(api_key: str) -> bytes:
+    """Fixed-width digest used for the indexed auth lookup"""
+    return hashlib.sha256(api_key.encode()).digest()
 
 def create_client(
     db: Session,
@@ -24,58 +48,82 @@ def create_client(
     plan_type: str = "free"
 ) -> Client:
     """Create a new client"""
-    
-    # Check if client already exists
-    existing = db.query(Client).filter(Client.id == client_id).first()
-    if existing:
-        raise ValueError(f"Client with ID {client_id} already exists")
-    
-    existing_email = db.query(Client).filter(Client.email == email).first()
-    if existing_email:
-        raise ValueError(f"Client with email {email} already exists")
-    
+
     # Generate API key
     api_key = generate_api_key()
     
-    # Set quota based on plan
-    quotas = {
-        "free": 1000,      # 1 GB
-        "basic": 10000,    # 10 GB
-        "premium": 100000  # 100 GB
-    }
-    
     client = Client(
         id=client_id,
         name=name,
         email=email,
         company=company,
         api_key=api_key,
+        api_key_hash=hash_api_key(api_key),
         plan_type=plan_type,
-        monthly_quota_mb=quotas.get(plan_type, 1000)
+        monthly_quota_mb=PLAN_QUOTAS_MB.get(plan_type, DEFAULT_QUOTA_MB)
     )
     
+    # Single INSERT; the unique constraints on id/email/api_key catch
+    # duplicates without the racy SELECT-then-INSERT existence checks
     db.add(client)
-    db.commit()
-    db.refresh(client)
-    
-    logger.info(f"Created client: {client_id} ({email})")
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        raise ValueError(
+            f"Client with ID {client_id} or email {email} already exists"
+        ) from e
+
+    logger.info("Created client: %s (%s)", client_id, email)
     return client
 
 def get_client(db: Session, client_id: str) -> Optional[Client]:
     """Get client by ID"""
-    return db.query(Client).filter(Client.id == client_id).first()
+    # PK lookup via the identity map: no SQL at all if the row is
+    # already loaded in this session
+    return db.get(Client, client_id)
 
 def get_client_by_email(db: Session, email: str) -> Optional[Client]:
     """Get client by email"""
     return db.query(Client).filter(Client.email == email).first()
 
 def get_client_by_api_key(db: Session, api_key: str) -> Optional[Client]:
-    """Get client by API key"""
-    return db.query(Client).filter(Client.api_key == api_key).first()
+    """Get client by API key (read-through Redis cache when configured)"""
+    client = cache.get_cached_client(api_key)
+    if client is not None:
+        return client
+
+    # 32-byte digest lookup: fixed-width index entries on the hot path
+    client = db.query(Client).filter(
+        Client.api_key_hash == hash_api_key(api_key)
+    ).first()
+    if client is None:
+        # Rows created before api_key_hash existed; backfill on first hit
+        client = db.query(Client).filter(Client.api_key == api_key).first()
+        if client is not None:
+            client.api_key_hash = hash_api_key(api_key)
+            db.commit()
+    if client is not None:
+        cache.cache_client(client)
+    return client
+
+def list_clients(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[Tuple[datetime, str]] = None,
+) -> List[Client]:
+    """List all clients with pagination.
 
-def list_clients(db: Session, skip: int = 0, limit: int = 100) -> List[Client]:
-    """List all clients with pagination"""
-    return db.query(Client).offset(skip).limit(limit).all()
+    ``cursor`` is the (created_at, id) of the last row of the previous
+    page; it replaces OFFSET with an index seek for deep pages.
+    """
+    query = db.query(Client).order_by(Client.created_at.desc(), Client.id.desc())
+    if cursor is not None:
+        query = query.filter(tuple_(Client.created_at, Client.id) < cursor)
+    elif skip:
+        query = query.offset(skip)
+    return query.limit(limit).all()
 
 def update_client(
     db: Session,
@@ -100,17 +148,18 @@ def update_client(
     if plan_type:
         client.plan_type = plan_type
         # Update quota based on new plan
-        quotas = {"free": 1000, "basic": 10000, "premium": 100000}
-        client.monthly_quota_mb = quotas.get(plan_type, 1000)
+        client.monthly_quota_mb = PLAN_QUOTAS_MB.get(plan_type, DEFAULT_QUOTA_MB)
     if is_active is not None:
         client.is_active = is_active
     
     client.updated_at = datetime.utcnow()
-    
+
     db.commit()
-    db.refresh(client)
-    
-    logger.info(f"Updated client: {client_id}")
+    # Plan changes move the quota limit; drop the local snapshot too
+    _quota_cache.pop(client_id, None)
+    cache.invalidate_client(client)
+
+    logger.info("Updated client: %s", client_id)
     return client
 
 def delete_client(db: Session, client_id: str) -> bool:
@@ -119,32 +168,68 @@ def delete_client(db: Session, client_id: str) -> bool:
     if not client:
         return False
     
+    cache.invalidate_client(client)
     db.delete(client)
     db.commit()
-    
-    logger.info(f"Deleted client: {client_id}")
+
+    logger.info("Deleted client: %s", client_id)
     return True
 
-def update_quota_usage(db: Session, client_id: str, mb_used: float) -> Optional[Client]:
+def update_quota_usage(
+    db: Session, client_id: str, mb_used: float, commit: bool = True
+) -> Optional[Client]:
     """Update client's quota usage"""
-    client = get_client(db, client_id)
-    if not client:
+    # SQL-side increment: no read-modify-write race when concurrent jobs
+    # finish for the same client, and no SELECT before the UPDATE
+    updated = db.query(Client).filter(Client.id == client_id).update(
+        {Client.used_quota_mb: Client.used_quota_mb + mb_used},
+        synchronize_session=False,
+    )
+    if commit:
+        db.commit()
+    if not updated:
         return None
-    
-    client.used_quota_mb += mb_used
-    db.commit()
-    db.refresh(client)
-    
-    logger.info(f"Updated quota for {client_id}: +{mb_used}MB (total: {client.used_quota_mb}MB)")
+
+    cache.incr_quota(client_id, mb_used)
+
+    # Keep the local snapshot additive so the next check_quota does not
+    # need a re-read
+    entry = _quota_cache.get(client_id)
+    if entry is not None:
+        _quota_cache[client_id] = (entry[0] + mb_used, entry[1], entry[2])
+
+    # populate_existing: the UPDATE above bypassed the ORM, so force the
+    # fresh row values over any stale identity-map copy
+    client = (
+        db.query(Client).populate_existing()
+        .filter(Client.id == client_id).first()
+    )
+    cache.invalidate_client(client)
+    # Hot write path: DEBUG and lazy %-args so the format is free when filtered
+    logger.debug("Updated quota for %s: +%sMB (total: %sMB)", client_id, mb_used, client.used_quota_mb)
     return client
 
 def check_quota(db: Session, client_id: str, required_mb: float) -> bool:
     """Check if client has enough quota"""
+    now = time.monotonic()
+    entry = _quota_cache.get(client_id)
+    if entry is not None:
+        used_mb, limit_mb, cached_at = entry
+        if now - cached_at < QUOTA_CHECK_TTL_SECONDS and used_mb + required_mb <= limit_mb:
+            return True
+
     client = get_client(db, client_id)
     if not client:
+        _quota_cache.pop(client_id, None)
         return False
-    
-    available = client.monthly_quota_mb - client.used_quota_mb
+
+    used_mb = cache.get_quota(client_id)
+    if used_mb is None:
+        used_mb = client.used_quota_mb
+        cache.seed_quota(client_id, used_mb)
+
+    _quota_cache[client_id] = (used_mb, client.monthly_quota_mb, now)
+    available = client.monthly_quota_mb - used_mb
     return available >= required_mb
 
 def reset_monthly_quota(db: Session, client_id: str) -> Optional[Client]:
@@ -155,7 +240,9 @@ def reset_monthly_quota(db: Session, client_id: str) -> Optional[Client]:
     
     client.used_quota_mb = 0.0
     db.commit()
-    db.refresh(client)
-    
-    logger.info(f"Reset quota for client: {client_id}")
+    _quota_cache.pop(client_id, None)
+    cache.seed_quota(client_id, 0.0)
+    cache.invalidate_client(client)
+
+    logger.info("Reset quota for client: %s", client_id)
     return client
\ No newline at end of file
@@ -1,5 +1,6 @@
-from sqlalchemy.orm import Session
-from typing import Optional, List
+from sqlalchemy import select, insert, update, func, case, literal, tuple_
+from sqlalchemy.orm import Session, selectinload
+from typing import Optional, List, Tuple
 from datetime import datetime
 
 from src.database.models import Job, QualityMetric, DataTypeEnum, JobStatusEnum
@@ -39,19 +40,36 @@ def create_job(
 
     db.add(job)
     db.commit()
-    db.refresh(job)
 
-    logger.info(f"Created job: {job_id} for client {client_id}")
+    logger.info("Created job: %s for client %s", job_id, client_id)
     return job
 
 
+def create_jobs_bulk(db: Session, mappings: List[dict]) -> int:
+    """Insert many jobs in one statement; returns the number inserted.
+
+    bulk_insert_mappings skips unit-of-work bookkeeping and uses the
+    driver's executemany path, so N submissions cost one round-trip
+    instead of N. Mappings must carry every column create_job would set.
+    """
+    if not mappings:
+        return 0
+
+    db.bulk_insert_mappings(Job, mappings)
+    db.commit()
+
+    logger.info("Bulk-created %d jobs", len(mappings))
+    return len(mappings)
+
+
 # =========================
 # GET JOB
 # =========================
 
 def get_job(db: Session, job_id: str) -> Optional[Job]:
     """Get job by ID"""
-    return db.query(Job).filter(Job.id == job_id).first()
+    # PK lookup via the identity map: skips the SELECT on repeat access
+    return db.get(Job, job_id)
 
 
 def list_jobs(
@@ -60,63 +78,128 @@ def list_jobs(
     status: Optional[JobStatusEnum] = None,
     skip: int = 0,
     limit: int = 100,
+    with_metrics: bool = False,
+    cursor: Optional[Tuple[datetime, str]] = None,
 ) -> List[Job]:
-    """List jobs with optional filters"""
+    """List jobs with optional filters.
+
+    Pass the (created_at, id) of the last row of a page as ``cursor`` to
+    fetch the next page as an index range scan; deep OFFSET pages scan
+    and discard ``skip`` rows each request. ``skip`` is ignored when a
+    cursor is given.
+    """
 
     query = db.query(Job)
 
+    if with_metrics:
+        # One extra SELECT for the whole page instead of one per job
+        query = query.options(selectinload(Job.quality_metrics))
+
     if client_id:
         query = query.filter(Job.client_id == client_id)
     if status:
         query = query.filter(Job.status == status)
 
-    return (
-        query.order_by(Job.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    query = query.order_by(Job.created_at.desc(), Job.id.desc())
+
+    if cursor is not None:
+        query = query.filter(tuple_(Job.created_at, Job.id) < cursor)
+    elif skip:
+        query = query.offset(skip)
+
+    return query.limit(limit).all()
 
 
 # =========================
 # UPDATE STATUS
 # =========================
 
+def _elapsed_seconds_expr(db: Session, completed_at: datetime):
+    """SQL expression for completed_at - started_at in seconds"""
+    if db.get_bind().dialect.name == "sqlite":
+        return (func.julianday(completed_at) - func.julianday(Job.started_at)) * 86400.0
+    return func.extract("epoch", literal(completed_at) - Job.started_at)
+
+
 def update_job_status(
     db: Session,
     job_id: str,
     status: JobStatusEnum,
     error_message: Optional[str] = None,
+    commit: bool = True,
 ) -> Optional[Job]:
-    """Update job status"""
+    """Update job status.
 
-    job = get_job(db, job_id)
-    if not job:
-        return None
+    Pass ``commit=False`` to leave the write in the caller's open
+    transaction; the caller then owns the commit.
+    """
 
-    job.status = status
+    # Single UPDATE .. RETURNING instead of SELECT + mutate + refresh;
+    # the conditional fields are computed SQL-side so no prior read of
+    # started_at is needed
+    now = datetime.utcnow()
+    values = {"status": status}
 
-    if status == JobStatusEnum.PROCESSING and not job.started_at:
-        job.started_at = datetime.utcnow()
+    if status == JobStatusEnum.PROCESSING:
+        values["started_at"] = func.coalesce(Job.started_at, now)
 
     if status == JobStatusEnum.COMPLETED:
-        job.completed_at = datetime.utcnow()
-        if job.started_at:
-            job.processing_time_seconds = (
-                job.completed_at - job.started_at
-            ).total_seconds()
+        values["completed_at"] = now
+        values["processing_time_seconds"] = case(
+            (Job.started_at.isnot(None), _elapsed_seconds_expr(db, now)),
+            else_=None,
+        )
 
     if status == JobStatusEnum.FAILED:
-        job.error_message = error_message
-        job.completed_at = datetime.utcnow()
+        values["error_message"] = error_message
+        values["completed_at"] = now
 
-    db.commit()
-    db.refresh(job)
+    job = db.scalars(
+        update(Job).where(Job.id == job_id).values(**values).returning(Job),
+        execution_options={"populate_existing": True},
+    ).one_or_none()
+    if commit:
+        db.commit()
+
+    if job is None:
+        return None
 
-    logger.info(f"Updated job {job_id} status to {status.value}")
+    logger.info("Updated job %s status to %s", job_id, status.value)
     return job
 
 
+def try_cancel_job(db: Session, job_id: str) -> bool:
+    """Atomically cancel a job that has not started.
+
+    One conditional UPDATE instead of SELECT-then-UPDATE: a single
+    round-trip and no window for the job to start in between. Returns
+    False when the job is missing or already running/finished.
+    """
+    # RETURNING(Job) + populate_existing keeps any identity-map copy of
+    # the row fresh for callers that re-read the job afterwards
+    cancelled = db.scalars(
+        update(Job)
+        .where(
+            Job.id == job_id,
+            Job.status.in_((JobStatusEnum.PENDING, JobStatusEnum.QUEUED)),
+        )
+        .values(
+            status=JobStatusEnum.FAILED,
+            error_message="Job cancelled by user",
+            completed_at=datetime.utcnow(),
+        )
+        .returning(Job),
+        execution_options={"populate_existing": True},
+    ).one_or_none()
+    db.commit()
+
+    if cancelled is None:
+        return False
+
+    logger.info("Cancelled job %s", job_id)
+    return True
+
+
 # =========================
 # QUALITY METRICS
 # =========================
@@ -125,30 +208,37 @@ def add_quality_metrics(
     db: Session,
     job_id: str,
     metrics: QualityMetricsModel,
-) -> Optional[QualityMetric]:
-    """Add quality metrics to a job"""
+    commit: bool = True,
+) -> Optional[int]:
+    """Add quality metrics to a job; returns the new metric row id.
+
+    Uses a Core insert: a single-child write has no cascades or
+    attribute history worth paying unit-of-work flush overhead for.
+    """
 
     job = get_job(db, job_id)
     if not job:
         return None
 
-    quality_metric = QualityMetric(
-        job_id=job_id,
-        total_records=metrics.total_records,
-        valid_records=metrics.valid_records,
-        invalid_records=metrics.invalid_records,
-        missing_values_percent=metrics.missing_values_percent,
-        duplicate_percent=metrics.duplicate_percent,
-        quality_score=metrics.quality_score,
-        issues=metrics.issues,
-    )
-
-    db.add(quality_metric)
-    db.commit()
-    db.refresh(quality_metric)
-
-    logger.info(f"Added quality metrics to job {job_id}")
-    return quality_metric
+    metric_id = db.execute(
+        insert(QualityMetric)
+        .values(
+            job_id=job_id,
+            total_records=metrics.total_records,
+            valid_records=metrics.valid_records,
+            invalid_records=metrics.invalid_records,
+            missing_values_percent=metrics.missing_values_percent,
+            duplicate_percent=metrics.duplicate_percent,
+            quality_score=metrics.quality_score,
+            issues=metrics.issues,
+        )
+        .returning(QualityMetric.id)
+    ).scalar_one()
+    if commit:
+        db.commit()
+
+    logger.info("Added quality metrics to job %s", job_id)
+    return metric_id
 
 
 # =========================
@@ -157,7 +247,14 @@ def add_quality_metrics(
 
 def get_job_with_metrics(db: Session, job_id: str) -> Optional[Job]:
     """Get job with quality metrics loaded"""
-    return db.query(Job).filter(Job.id == job_id).first()
+    # Eager-load the relationship so accessing job.quality_metrics later
+    # does not fire a lazy SELECT per job
+    return (
+        db.query(Job)
+        .options(selectinload(Job.quality_metrics))
+        .filter(Job.id == job_id)
+        .first()
+    )
 
 
 # =========================
@@ -174,7 +271,7 @@ def delete_job(db: Session, job_id: str) -> bool:
     db.delete(job)
     db.commit()
 
-    logger.info(f"Deleted job: {job_id}")
+    logger.info("Deleted job: %s", job_id)
     return True
 
 
@@ -182,14 +279,38 @@ def delete_job(db: Session, job_id: str) -> bool:
 # STATS
 # =========================
 
+def get_job_status_row(db: Session, job_id: str):
+    """Projected status lookup for polling: five columns, no entities.
+
+    Returns a Row of (status, created_at, completed_at, error_message,
+    quality_score) or None - cheaper than hydrating the Job plus its
+    quality_metrics relation just to read a handful of fields.
+    """
+    return (
+        db.query(
+            Job.status,
+            Job.created_at,
+            Job.completed_at,
+            Job.error_message,
+            QualityMetric.quality_score,
+        )
+        .outerjoin(QualityMetric, QualityMetric.job_id == Job.id)
+        .filter(Job.id == job_id)
+        .first()
+    )
+
+
 def get_client_job_count(db: Session, client_id: str) -> int:
     """Get total number of jobs for a client"""
-    return db.query(Job).filter(Job.client_id == client_id).count()
+    # Plain SELECT COUNT(*), no subquery wrapper like Query.count() emits
+    return db.scalar(select(func.count(Job.id)).where(Job.client_id == client_id))
 
 
 def get_client_completed_jobs(db: Session, client_id: str) -> int:
     """Get number of completed jobs for a client"""
-    return db.query(Job).filter(
-        Job.client_id == client_id,
-        Job.status == JobStatusEnum.COMPLETED,
-    ).count()
\ No newline at end of file
+    return db.scalar(
+        select(func.count(Job.id)).where(
+            Job.client_id == client_id,
+            Job.status == JobStatusEnum.COMPLETED,
+        )
+    )
\ No newline at end of file
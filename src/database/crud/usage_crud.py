@@ -1,12 +1,37 @@
+from sqlalchemy import insert, select, func, tuple_
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
+from functools import lru_cache
 
 from src.database.models import UsageLog, DataTypeEnum
+from src.database import cache
 from src.utils.logger import get_logger
 
 logger = get_logger("usage_crud")
 
+def log_usage_many(db: Session, entries: List[dict], commit: bool = True) -> List[int]:
+    """Insert a batch of usage log entries in one statement.
+
+    Each dict maps UsageLog column names to values. The insert goes
+    through SQLAlchemy's executemany path in a single transaction and
+    RETURNING supplies the generated ids without per-row refreshes.
+    """
+    if not entries:
+        return []
+    result = db.execute(insert(UsageLog).returning(UsageLog.id), entries)
+    ids = [row[0] for row in result]
+    if commit:
+        db.commit()
+
+    # New usage changes this month's summary for each affected client
+    period = datetime.utcnow().strftime("%Y%m")
+    for client_id in {e["client_id"] for e in entries}:
+        cache.invalidate_usage_summary(client_id, period)
+
+    logger.info("Logged %d usage entries", len(entries))
+    return ids
+
 def log_usage(
     db: Session,
     client_id: str,
@@ -14,56 +39,84 @@ def log_usage(
     data_size_mb: float,
     processing_time_seconds: float,
     data_type: DataTypeEnum,
-    cost_usd: float = 0.0
+    cost_usd: float = 0.0,
+    commit: bool = True,
 ) -> UsageLog:
     """Records the historical log entry for a specific job"""
-    usage = UsageLog(
-        client_id=client_id,
-        job_id=job_id,
-        data_size_mb=data_size_mb,
-        processing_time_seconds=processing_time_seconds,
-        data_type=data_type,
-        cost_usd=cost_usd
-    )
-    db.add(usage)
-    db.commit()
-    db.refresh(usage)
-    logger.info(f"Logged usage for client {client_id}: {data_size_mb}MB")
-    return usage
+    [usage_id] = log_usage_many(db, commit=commit, entries=[{
+        "client_id": client_id,
+        "job_id": job_id,
+        "data_size_mb": data_size_mb,
+        "processing_time_seconds": processing_time_seconds,
+        "data_type": data_type,
+        "cost_usd": cost_usd
+    }])
+    logger.debug("Logged usage for client %s: %sMB", client_id, data_size_mb)
+    return db.get(UsageLog, usage_id)
 
 def get_client_usage(
     db: Session,
     client_id: str,
     start_date: Optional[datetime] = None,
-    end_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[Tuple[datetime, int]] = None
 ) -> List[UsageLog]:
-    """Get usage logs for a client with date filter"""
+    """Get usage logs for a client with date filter.
+
+    ``cursor`` is the (timestamp, id) of the last row of the previous
+    page, for keyset pagination over large histories.
+    """
     query = db.query(UsageLog).filter(UsageLog.client_id == client_id)
-    
+
     if start_date:
         query = query.filter(UsageLog.timestamp >= start_date)
     if end_date:
         query = query.filter(UsageLog.timestamp <= end_date)
-    
-    return query.order_by(UsageLog.timestamp.desc()).all()
+    if cursor is not None:
+        query = query.filter(tuple_(UsageLog.timestamp, UsageLog.id) < cursor)
+
+    query = query.order_by(UsageLog.timestamp.desc(), UsageLog.id.desc())
+    if limit is not None:
+        query = query.limit(limit)
+    return query.all()
+
+@lru_cache(maxsize=1)
+def _month_start(year: int, month: int) -> datetime:
+    """Start of the given month; cached until the month rolls over"""
+    return datetime(year, month, 1)
 
 def get_monthly_usage_summary(db: Session, client_id: str) -> dict:
     """Aggregates historical logs for the current month"""
     now = datetime.utcnow()
-    start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    
-    usage_logs = get_client_usage(db, client_id, start_date=start_of_month)
-    
-    total_mb = sum(log.data_size_mb for log in usage_logs)
-    total_jobs = len(usage_logs)
-    total_time = sum(log.processing_time_seconds for log in usage_logs)
-    total_cost = sum(log.cost_usd for log in usage_logs)
-    
-    return {
+    start_of_month = _month_start(now.year, now.month)
+
+    # Dashboards poll this; repeat hits within the TTL stay in Redis
+    period = now.strftime("%Y%m")
+    cached = cache.get_usage_summary(client_id, period)
+    if cached is not None:
+        return cached
+
+    # One aggregated row from the DB instead of hydrating every log
+    total_mb, total_jobs, total_time, total_cost = db.execute(
+        select(
+            func.coalesce(func.sum(UsageLog.data_size_mb), 0),
+            func.count(UsageLog.id),
+            func.coalesce(func.sum(UsageLog.processing_time_seconds), 0),
+            func.coalesce(func.sum(UsageLog.cost_usd), 0),
+        ).where(
+            UsageLog.client_id == client_id,
+            UsageLog.timestamp >= start_of_month,
+        )
+    ).one()
+
+    summary = {
         'total_data_mb': round(total_mb, 2),
         'total_jobs': total_jobs,
         'total_processing_time_seconds': round(total_time, 2),
         'total_cost_usd': round(total_cost, 2),
         'period_start': start_of_month.isoformat(),
         'period_end': now.isoformat()
-    }
\ No newline at end of file
+    }
+    cache.cache_usage_summary(client_id, period, summary)
+    return summary
\ No newline at end of file
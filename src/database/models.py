@@ -1,4 +1,5 @@
-from sqlalchemy import Column, String, Integer, Float, DateTime, Text, JSON, Boolean, ForeignKey, Enum
+from sqlalchemy import Column, String, Integer, Float, DateTime, Text, JSON, Boolean, ForeignKey, Enum, Index, LargeBinary, text, TypeDecorator
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -6,6 +7,21 @@ import enum
 
 Base = declarative_base()
 
+class JSONColumn(TypeDecorator):
+    """JSON that lands as JSONB on Postgres (binary storage, GIN-indexable).
+
+    Serialization itself goes through the engine's json_serializer /
+    json_deserializer (orjson when available, see connection.py), so
+    this decorator only picks the storage type per dialect.
+    """
+    impl = JSON
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(JSON())
+
 class DataTypeEnum(enum.Enum):
     """Data type enumeration"""
     TABULAR = "tabular"
@@ -16,6 +32,7 @@ class DataTypeEnum(enum.Enum):
 class JobStatusEnum(enum.Enum):
     """Job status enumeration"""
     PENDING = "pending"
+    QUEUED = "queued"
     PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
@@ -29,6 +46,10 @@ class Client(Base):
     email = Column(String, unique=True, nullable=False)
     company = Column(String, nullable=True)
     api_key = Column(String, unique=True, nullable=False)
+    # Fixed-width SHA-256 digest used for the auth lookup; nullable so
+    # rows from before the column existed keep working (backfilled on
+    # first successful plaintext lookup)
+    api_key_hash = Column(LargeBinary(32), unique=True, index=True, nullable=True)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -49,7 +70,21 @@ class Client(Base):
 class Job(Base):
     """Job table for tracking preprocessing jobs"""
     __tablename__ = "jobs"
-    
+
+    # Covers the list/stat queries: filter by client (plus status) with
+    # ORDER BY created_at DESC as an index-ordered scan instead of a filesort
+    __table_args__ = (
+        Index("ix_jobs_client_status_created", "client_id", "status", "created_at"),
+        # Partial index over the active slice only: stays small as
+        # COMPLETED/FAILED rows accumulate. Enum columns store the member
+        # name, hence the uppercase literals
+        Index(
+            "ix_jobs_active", "client_id", "created_at",
+            postgresql_where=text("status IN ('PENDING', 'QUEUED', 'PROCESSING')"),
+            sqlite_where=text("status IN ('PENDING', 'QUEUED', 'PROCESSING')"),
+        ),
+    )
+
     id = Column(String, primary_key=True)
     client_id = Column(String, ForeignKey("clients.id"), nullable=False)
     
@@ -71,8 +106,8 @@ class Job(Base):
     processing_time_seconds = Column(Float, nullable=True)
     
     # Configuration
-    config = Column(JSON, nullable=True)
-    job_metadata = Column(JSON, nullable=True)
+    config = Column(JSONColumn, nullable=True)
+    job_metadata = Column(JSONColumn, nullable=True)
     
     # Relationships
     client = relationship("Client", back_populates="jobs")
@@ -97,7 +132,7 @@ class QualityMetric(Base):
     quality_score = Column(Float, nullable=False)
     
     # Issues
-    issues = Column(JSON, nullable=True)  # List of issues found
+    issues = Column(JSONColumn, nullable=True)  # List of issues found
     
     created_at = Column(DateTime, default=datetime.utcnow)
     
@@ -110,7 +145,12 @@ class QualityMetric(Base):
 class UsageLog(Base):
     """Usage tracking for billing and analytics"""
     __tablename__ = "usage_logs"
-    
+
+    # get_client_usage filters by client + timestamp range, newest first
+    __table_args__ = (
+        Index("ix_usage_client_ts", "client_id", "timestamp"),
+    )
+
     id = Column(Integer, primary_key=True, autoincrement=True)
     client_id = Column(String, ForeignKey("clients.id"), nullable=False)
     job_id = Column(String, ForeignKey("jobs.id"), nullable=True)
@@ -1,7 +1,16 @@
+import functools
+import hashlib
+import importlib
+import json
+import os
+import threading
+import time
 import uuid
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
@@ -12,16 +21,16 @@ from src.core.models import (
     ProcessingConfig,
     QualityMetrics,
 )
-from src.core.tabular_processor import TabularProcessor
-from src.core.image_processor import ImageProcessor
-from src.core.text_processor import TextProcessor
-
 from src.database import get_db
 from src.database.crud import (
     create_job,
+    create_jobs_bulk,
     get_job as get_job_db,
+    get_job_with_metrics,
+    get_job_status_row,
     list_jobs as list_jobs_db,
     update_job_status,
+    try_cancel_job,
     add_quality_metrics,
     log_usage,
     update_quota_usage,
@@ -34,21 +43,219 @@ from config.settings import settings
 
 logger = get_logger("job_manager")
 
+# DB enum -> API enum translation tables; a dict hit replaces the
+# hasattr/.value dance per row in the list conversion loop
+_DATA_TYPE_MAP = {member: DataType(member.value) for member in DataTypeEnum}
+_STATUS_MAP = {member: ProcessingStatus(member.value) for member in JobStatusEnum}
+_DATA_TYPE_TO_ENUM = {api: db for db, api in _DATA_TYPE_MAP.items()}
+
+
+def _dir_size_bytes(path: str) -> int:
+    """Total size of a directory tree via os.scandir.
+
+    DirEntry.stat() reuses the data the kernel returned during the
+    directory read, so this avoids the per-file Path allocation and
+    extra stat syscall that rglob('*') pays.
+    """
+    total = 0
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
+# Processor modules pull in pandas/Pillow/NLTK; importing them lazily
+# keeps API boot (and every uvicorn reload) from paying for data types
+# that are never used
+_PROCESSOR_PATHS = {
+    DataType.TABULAR: ("src.core.tabular_processor", "TabularProcessor"),
+    DataType.IMAGE: ("src.core.image_processor", "ImageProcessor"),
+    DataType.TEXT: ("src.core.text_processor", "TextProcessor"),
+}
+
+
+def _utcnow() -> datetime:
+    """Naive UTC now without the deprecated datetime.utcnow().
+
+    The database layer stores naive UTC timestamps throughout, so the
+    tz-aware reading is stripped to match.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _with_db(fn):
+    """Inject a session as ``db`` when the caller did not pass one.
+
+    Replaces the ``if db is None: with get_db() as session:`` block
+    repeated across every public JobManager method. ``db`` must be
+    passed by keyword. Sessions connect lazily, so decorated methods
+    that return from an in-memory cache never touch the engine.
+    """
+    @functools.wraps(fn)
+    def wrapper(self, *args, db: Optional[Session] = None, **kwargs):
+        if db is not None:
+            return fn(self, *args, db=db, **kwargs)
+        with get_db() as session:
+            return fn(self, *args, db=session, **kwargs)
+    return wrapper
+
+
+# One JobManager per worker process, built lazily on the first task so
+# the pool's processes keep warm processor caches across jobs
+_worker_manager = None
+
+
+def _worker_pool_init():
+    """Runs once in each pool worker before any task.
+
+    A forked worker inherits the parent's engine along with its pooled
+    connections (the import-time pre-warm guarantees at least one is
+    live at fork), and sharing one DB socket across processes corrupts
+    the wire protocol. dispose(close=False) makes the child abandon the
+    inherited pool and open its own connections while leaving the
+    parent's descriptors untouched.
+    """
+    from src.database.connection import engine
+    engine.dispose(close=False)
+
+
+def _run_job_in_worker(job_id: str):
+    """Entry point executed inside a ProcessPoolExecutor worker"""
+    global _worker_manager
+    if _worker_manager is None:
+        _worker_manager = JobManager()
+
+    with get_db() as session:
+        db_job = get_job_db(session, job_id)
+        # Cancelled (or already finished) while queued
+        if db_job is None or db_job.status in (
+            JobStatusEnum.COMPLETED,
+            JobStatusEnum.FAILED,
+        ):
+            return
+        _worker_manager.execute_job(job_id, db=session)
+
 
 class JobManager:
     """Manages preprocessing jobs with database persistence"""
 
+    # Bounded LRU of converted terminal jobs (see _cache_if_terminal)
+    JOB_CACHE_MAX = 1024
+    # Processors reused across jobs that share a config (see _get_processor)
+    PROCESSOR_CACHE_MAX = 8
+    # Per-client output parents already created this process; shared
+    # across instances so repeat jobs skip the parents=True stat walk
+    _known_dirs: set = set()
+
     def __init__(self):
-        self.processors = {
-            DataType.TABULAR: TabularProcessor,
-            DataType.IMAGE: ImageProcessor,
-            DataType.TEXT: TextProcessor,
-        }
+        # DataType -> processor class, filled on first use from
+        # _PROCESSOR_PATHS
+        self.processors = {}
+        # COMPLETED/FAILED jobs never change again, so their converted
+        # Pydantic form can be served to polling clients without a
+        # SELECT or re-conversion per request
+        self._terminal_job_cache: "OrderedDict[str, ProcessingJob]" = OrderedDict()
+        # Processor init is not free (TextProcessor loads NLTK corpora,
+        # ImageProcessor sets up transforms); jobs sharing a config get
+        # the same warm instance. Processors must stay side-effect-free
+        # across process() calls for this to hold
+        self._processor_cache: "OrderedDict[tuple, object]" = OrderedDict()
+        self._processor_lock = threading.Lock()
+        # Worker pool for submit_job; created on first use so managers
+        # built for synchronous execute_job never fork processes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def _ensure_parent_dir(self, parent: Path) -> None:
+        """mkdir -p the client output parent, once per process"""
+        if parent not in self._known_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(parent)
+
+    def _get_processor_cls(self, data_type: DataType):
+        """Import and cache the processor class for a data type"""
+        cls = self.processors.get(data_type)
+        if cls is None:
+            path = _PROCESSOR_PATHS.get(data_type)
+            if path is None:
+                raise ValueError(f"No processor for {data_type}")
+            module_name, cls_name = path
+            cls = getattr(importlib.import_module(module_name), cls_name)
+            self.processors[data_type] = cls
+        return cls
+
+    def _get_processor(self, data_type: DataType, config: Optional[dict]):
+        """Get or build a processor for (data_type, config)"""
+        processor_cls = self._get_processor_cls(data_type)
+
+        cfg_key = hashlib.blake2b(
+            json.dumps(config or {}, sort_keys=True).encode(),
+            digest_size=16,
+        ).hexdigest()
+        key = (data_type, cfg_key)
+
+        with self._processor_lock:
+            processor = self._processor_cache.get(key)
+            if processor is None:
+                processor = processor_cls(
+                    ProcessingConfig(**config) if config else ProcessingConfig()
+                )
+                self._processor_cache[key] = processor
+            self._processor_cache.move_to_end(key)
+            while len(self._processor_cache) > self.PROCESSOR_CACHE_MAX:
+                self._processor_cache.popitem(last=False)
+        return processor
+
+    def _cache_if_terminal(self, job: ProcessingJob) -> None:
+        if job.status in (ProcessingStatus.COMPLETED, ProcessingStatus.FAILED):
+            self._terminal_job_cache[job.job_id] = job
+            self._terminal_job_cache.move_to_end(job.job_id)
+            while len(self._terminal_job_cache) > self.JOB_CACHE_MAX:
+                self._terminal_job_cache.popitem(last=False)
+
+    @staticmethod
+    def _to_processing_job(db_job) -> ProcessingJob:
+        """Convert a Job row (with metrics loaded) to the API model"""
+        data_type = _DATA_TYPE_MAP.get(db_job.data_type) or DataType(str(db_job.data_type))
+        status = _STATUS_MAP.get(db_job.status) or ProcessingStatus(str(db_job.status))
+
+        quality_metrics = None
+        if db_job.quality_metrics:
+            quality_metrics = QualityMetrics(
+                total_records=db_job.quality_metrics.total_records,
+                valid_records=db_job.quality_metrics.valid_records,
+                invalid_records=db_job.quality_metrics.invalid_records,
+                missing_values_percent=db_job.quality_metrics.missing_values_percent,
+                duplicate_percent=db_job.quality_metrics.duplicate_percent,
+                quality_score=db_job.quality_metrics.quality_score,
+                issues=db_job.quality_metrics.issues or [],
+            )
+
+        return ProcessingJob(
+            job_id=db_job.id,
+            client_id=db_job.client_id,
+            data_type=data_type,
+            status=status,
+            input_path=db_job.input_path,
+            output_path=db_job.output_path,
+            created_at=db_job.created_at,
+            completed_at=db_job.completed_at,
+            error_message=db_job.error_message,
+            quality_metrics=quality_metrics,
+            config=db_job.config or {},
+            metadata=db_job.job_metadata or {},
+        )
 
     # =========================
     # CREATE JOB
     # =========================
 
+    @_with_db
     def create_job(
         self,
         client_id: str,
@@ -58,41 +265,29 @@ class JobManager:
         db: Optional[Session] = None,
     ) -> ProcessingJob:
 
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
 
         input_file = Path(input_path)
         output_dir = Path(settings.PROCESSED_DATA_DIR) / client_id / job_id
-        output_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_parent_dir(output_dir.parent)
+        # Parent is known to exist, so the per-job dir is one mkdir
+        output_dir.mkdir(exist_ok=True)
         output_path = str(output_dir / f"processed_{input_file.name}")
 
         # Normalize data_type to handle both Enum and raw strings
-        dt_value = data_type.value if isinstance(data_type, DataType) else str(data_type)
-        data_type_enum = DataTypeEnum(dt_value)
-        data_type_obj = data_type if isinstance(data_type, DataType) else DataType(dt_value)
-
-        if db is None:
-            with get_db() as session:
-                create_job(
-                    db=session,
-                    job_id=job_id,
-                    client_id=client_id,
-                    data_type=data_type_enum,
-                    input_path=input_path,
-                    output_path=output_path,
-                    config=config.model_dump() if config else {},
-                    job_metadata={},
-                )
-        else:
-            create_job(
-                db=db,
-                job_id=job_id,
-                client_id=client_id,
-                data_type=data_type_enum,
-                input_path=input_path,
-                output_path=output_path,
-                config=config.model_dump() if config else {},
-                job_metadata={},
-            )
+        data_type_obj = data_type if isinstance(data_type, DataType) else DataType(str(data_type))
+        data_type_enum = _DATA_TYPE_TO_ENUM[data_type_obj]
+
+        create_job(
+            db=db,
+            job_id=job_id,
+            client_id=client_id,
+            data_type=data_type_enum,
+            input_path=input_path,
+            output_path=output_path,
+            config=config.as_dict() if config else {},
+            job_metadata={},
+        )
 
         logger.info(f"Created job {job_id} for client {client_id}")
 
@@ -105,43 +300,140 @@ class JobManager:
             output_path=output_path,
         )
 
+    @_with_db
+    def create_jobs_batch(
+        self,
+        specs: List[dict],
+        db: Optional[Session] = None,
+    ) -> List[ProcessingJob]:
+        """Create many jobs in one INSERT round-trip.
+
+        Each spec is a dict with the create_job arguments: client_id,
+        data_type, input_path and optionally config. Output directories
+        are created in a thread pool and the rows go through one
+        bulk insert, so bulk submission costs one round-trip instead of
+        one per job.
+        """
+        if not specs:
+            return []
+
+        now = _utcnow()
+        prepared = []
+        for spec in specs:
+            job_id = uuid.uuid4().hex
+            client_id = spec["client_id"]
+            input_path = spec["input_path"]
+            data_type = spec["data_type"]
+            config = spec.get("config")
+
+            data_type_obj = (
+                data_type if isinstance(data_type, DataType) else DataType(str(data_type))
+            )
+            output_dir = Path(settings.PROCESSED_DATA_DIR) / client_id / job_id
+            output_path = str(output_dir / f"processed_{Path(input_path).name}")
+            prepared.append(
+                (job_id, client_id, data_type_obj, input_path, output_dir, output_path, config)
+            )
+
+        # Parents first (one per client), then only the leaf dirs need
+        # creating; mkdir is a blocking syscall per directory, so
+        # overlap the leaves
+        for parent in {p[4].parent for p in prepared}:
+            self._ensure_parent_dir(parent)
+        with ThreadPoolExecutor(max_workers=min(8, len(prepared))) as pool:
+            list(
+                pool.map(
+                    lambda d: d.mkdir(exist_ok=True),
+                    (p[4] for p in prepared),
+                )
+            )
+
+        mappings = [
+            {
+                "id": job_id,
+                "client_id": client_id,
+                "data_type": _DATA_TYPE_TO_ENUM[data_type_obj],
+                "status": JobStatusEnum.PENDING,
+                "input_path": input_path,
+                "output_path": output_path,
+                "config": config.as_dict() if config else {},
+                "job_metadata": {},
+                "created_at": now,
+            }
+            for job_id, client_id, data_type_obj, input_path, _, output_path, config in prepared
+        ]
+
+        create_jobs_bulk(db, mappings)
+
+        logger.info(f"Created {len(prepared)} jobs in batch")
+
+        # Built from what we just wrote; no re-SELECT needed
+        return [
+            ProcessingJob(
+                job_id=job_id,
+                client_id=client_id,
+                data_type=data_type_obj,
+                status=ProcessingStatus.PENDING,
+                input_path=input_path,
+                output_path=output_path,
+            )
+            for job_id, client_id, data_type_obj, input_path, _, output_path, _cfg in prepared
+        ]
+
     # =========================
     # EXECUTE JOB
     # =========================
 
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=settings.JOB_WORKERS,
+                        initializer=_worker_pool_init,
+                    )
+        return self._executor
+
+    @_with_db
+    def submit_job(self, job_id: str, db: Optional[Session] = None) -> Future:
+        """Queue a job on the worker pool and return immediately.
+
+        The request thread only marks the job QUEUED; a worker process
+        opens its own session and runs the pipeline, so request latency
+        is decoupled from processing time. Poll get_job_status for
+        progress. execute_job remains the synchronous path.
+        """
+        # Re-submitting a terminal job (e.g. retrying after cancel) must
+        # drop its cached snapshot, or polls would see the old run forever
+        self._terminal_job_cache.pop(job_id, None)
+        update_job_status(db, job_id, JobStatusEnum.QUEUED)
+
+        future = self._get_executor().submit(_run_job_in_worker, job_id)
+        logger.info(f"Submitted job {job_id} to worker pool")
+        return future
+
+    @_with_db
     def execute_job(self, job_id: str, db: Optional[Session] = None) -> ProcessingJob:
-        if db is None:
-            with get_db() as session:
-                return self._execute_job_with_db(job_id, session)
-        else:
-            return self._execute_job_with_db(job_id, db)
-
-    def _execute_job_with_db(self, job_id: str, db: Session) -> ProcessingJob:
+        # Terminal jobs can be re-executed (the execute endpoint has no
+        # status guard), so any cached terminal snapshot is now stale
+        self._terminal_job_cache.pop(job_id, None)
         db_job = get_job_db(db, job_id)
         if not db_job:
             raise ValueError(f"Job {job_id} not found")
 
         update_job_status(db, job_id, JobStatusEnum.PROCESSING)
-        start_time = datetime.utcnow()
+        # Monotonic clock for duration: immune to wall-clock steps and
+        # cheaper than allocating datetimes
+        start_perf = time.perf_counter()
 
         try:
             dt_val = db_job.data_type.value if hasattr(db_job.data_type, "value") else str(db_job.data_type)
             data_type = DataType(dt_val)
-            processor_cls = self.processors.get(data_type)
-
-            if not processor_cls:
-                raise ValueError(f"No processor for {data_type}")
-
-            config = (
-                ProcessingConfig(**db_job.config)
-                if db_job.config
-                else ProcessingConfig()
-            )
-            processor = processor_cls(config)
+            processor = self._get_processor(data_type, db_job.config)
 
             input_path = Path(db_job.input_path)
             file_size_mb = (
-                sum(f.stat().st_size for f in input_path.rglob("*") if f.is_file())
+                _dir_size_bytes(db_job.input_path)
                 if input_path.is_dir()
                 else input_path.stat().st_size
             ) / (1024 * 1024)
@@ -158,10 +450,12 @@ class JobManager:
             else:
                 raise ValueError("Unsupported data type")
 
-            processing_time = (datetime.utcnow() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_perf
 
-            update_job_status(db, job_id, JobStatusEnum.COMPLETED)
-            add_quality_metrics(db, job_id, metrics)
+            # All four completion writes share one transaction: one
+            # commit (one fsync) instead of four
+            update_job_status(db, job_id, JobStatusEnum.COMPLETED, commit=False)
+            add_quality_metrics(db, job_id, metrics, commit=False)
 
             log_usage(
                 db=db,
@@ -170,9 +464,11 @@ class JobManager:
                 data_size_mb=file_size_mb,
                 processing_time_seconds=processing_time,
                 data_type=db_job.data_type,
+                commit=False,
             )
 
-            update_quota_usage(db, db_job.client_id, file_size_mb)
+            update_quota_usage(db, db_job.client_id, file_size_mb, commit=False)
+            db.commit()
 
             logger.info(f"Job {job_id} completed successfully")
 
@@ -184,11 +480,14 @@ class JobManager:
                 input_path=db_job.input_path,
                 output_path=db_job.output_path,
                 created_at=db_job.created_at,
-                completed_at=datetime.utcnow(),
+                completed_at=_utcnow(),
                 quality_metrics=metrics,
             )
 
         except Exception as e:
+            # Drop any uncommitted completion writes before recording
+            # the failure, so the FAILED commit does not carry them
+            db.rollback()
             update_job_status(
                 db,
                 job_id,
@@ -202,56 +501,27 @@ class JobManager:
     # GET JOB
     # =========================
 
+    @_with_db
     def get_job(self, job_id: str, db: Optional[Session] = None) -> Optional[ProcessingJob]:
         """Get job by ID"""
-        if db is None:
-            with get_db() as session:
-                return self._get_job_with_db(job_id, session)
-        else:
-            return self._get_job_with_db(job_id, db)
-
-    def _get_job_with_db(self, job_id: str, db: Session) -> Optional[ProcessingJob]:
-        """Internal method to get job with database session"""
-        db_job = get_job_db(db, job_id)
+        cached = self._terminal_job_cache.get(job_id)
+        if cached is not None:
+            self._terminal_job_cache.move_to_end(job_id)
+            return cached
+
+        db_job = get_job_with_metrics(db, job_id)
         if not db_job:
             return None
 
-        # Convert database model to ProcessingJob
-        dt_val = db_job.data_type.value if hasattr(db_job.data_type, "value") else str(db_job.data_type)
-        st_val = db_job.status.value if hasattr(db_job.status, "value") else str(db_job.status)
-        data_type = DataType(dt_val)
-        status = ProcessingStatus(st_val)
-
-        quality_metrics = None
-        if db_job.quality_metrics:
-            quality_metrics = QualityMetrics(
-                total_records=db_job.quality_metrics.total_records,
-                valid_records=db_job.quality_metrics.valid_records,
-                invalid_records=db_job.quality_metrics.invalid_records,
-                missing_values_percent=db_job.quality_metrics.missing_values_percent,
-                duplicate_percent=db_job.quality_metrics.duplicate_percent,
-                quality_score=db_job.quality_metrics.quality_score,
-                issues=db_job.quality_metrics.issues or [],
-            )
-
-        return ProcessingJob(
-            job_id=db_job.id,
-            client_id=db_job.client_id,
-            data_type=data_type,
-            status=status,
-            input_path=db_job.input_path,
-            output_path=db_job.output_path,
-            created_at=db_job.created_at,
-            completed_at=db_job.completed_at,
-            error_message=db_job.error_message,
-            quality_metrics=quality_metrics,
-            metadata=db_job.job_metadata or {},
-        )
+        job = self._to_processing_job(db_job)
+        self._cache_if_terminal(job)
+        return job
 
     # =========================
     # LIST JOBS
     # =========================
 
+    @_with_db
     def list_jobs(
         self,
         client_id: Optional[str] = None,
@@ -261,21 +531,6 @@ class JobManager:
         db: Optional[Session] = None,
     ) -> list[ProcessingJob]:
         """List jobs with optional filters"""
-        if db is None:
-            with get_db() as session:
-                return self._list_jobs_with_db(client_id, status, skip, limit, session)
-        else:
-            return self._list_jobs_with_db(client_id, status, skip, limit, db)
-
-    def _list_jobs_with_db(
-        self,
-        client_id: Optional[str],
-        status: Optional[ProcessingStatus],
-        skip: int,
-        limit: int,
-        db: Session,
-    ) -> list[ProcessingJob]:
-        """Internal method to list jobs with database session"""
         status_enum = None
         if status:
             status_enum = JobStatusEnum(status.value)
@@ -286,43 +541,14 @@ class JobManager:
             status=status_enum,
             skip=skip,
             limit=limit,
+            with_metrics=True,
         )
 
         jobs = []
         for db_job in db_jobs:
-            dt_val = db_job.data_type.value if hasattr(db_job.data_type, "value") else str(db_job.data_type)
-            st_val = db_job.status.value if hasattr(db_job.status, "value") else str(db_job.status)
-            data_type = DataType(dt_val)
-            job_status = ProcessingStatus(st_val)
-
-            quality_metrics = None
-            if db_job.quality_metrics:
-                quality_metrics = QualityMetrics(
-                    total_records=db_job.quality_metrics.total_records,
-                    valid_records=db_job.quality_metrics.valid_records,
-                    invalid_records=db_job.quality_metrics.invalid_records,
-                    missing_values_percent=db_job.quality_metrics.missing_values_percent,
-                    duplicate_percent=db_job.quality_metrics.duplicate_percent,
-                    quality_score=db_job.quality_metrics.quality_score,
-                    issues=db_job.quality_metrics.issues or [],
-                )
-
-            jobs.append(
-                ProcessingJob(
-                    job_id=db_job.id,
-                    client_id=db_job.client_id,
-                    data_type=data_type,
-                    status=job_status,
-                    input_path=db_job.input_path,
-                    output_path=db_job.output_path,
-                    created_at=db_job.created_at,
-                    completed_at=db_job.completed_at,
-                    error_message=db_job.error_message,
-                    quality_metrics=quality_metrics,
-                    config=db_job.config or {},
-                    metadata=db_job.job_metadata or {},
-                )
-            )
+            job = self._to_processing_job(db_job)
+            self._cache_if_terminal(job)
+            jobs.append(job)
 
         return jobs
 
@@ -330,51 +556,53 @@ class JobManager:
     # GET JOB STATUS
     # =========================
 
+    @_with_db
     def get_job_status(self, job_id: str, db: Optional[Session] = None) -> dict:
         """Get job status as dictionary"""
-        job = self.get_job(job_id, db)
-        if not job:
+        # Terminal cache first: the session injected above only
+        # connects if we fall through to the row query
+        cached = self._terminal_job_cache.get(job_id)
+        if cached is not None:
+            st = cached.status.value if hasattr(cached.status, "value") else str(cached.status)
+            return {
+                "job_id": job_id,
+                "status": st,
+                "created_at": cached.created_at.isoformat() if cached.created_at else None,
+                "started_at": None,  # Could be added to ProcessingJob model
+                "completed_at": cached.completed_at.isoformat() if cached.completed_at else None,
+                "error_message": cached.error_message,
+                "quality_score": cached.quality_metrics.quality_score if cached.quality_metrics else None,
+            }
+
+        # Projected five-column lookup; no entity or Pydantic build
+        row = get_job_status_row(db, job_id)
+        if row is None:
             return {"error": "Job not found"}
 
-        st = job.status.value if hasattr(job.status, "value") else str(job.status)
+        status, created_at, completed_at, error_message, quality_score = row
+        st = status.value if hasattr(status, "value") else str(status)
         return {
-            "job_id": job.job_id,
+            "job_id": job_id,
             "status": st,
-            "created_at": job.created_at.isoformat() if job.created_at else None,
+            "created_at": created_at.isoformat() if created_at else None,
             "started_at": None,  # Could be added to ProcessingJob model
-            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-            "error_message": job.error_message,
-            "quality_score": job.quality_metrics.quality_score if job.quality_metrics else None,
+            "completed_at": completed_at.isoformat() if completed_at else None,
+            "error_message": error_message,
+            "quality_score": quality_score,
         }
 
     # =========================
     # CANCEL JOB
     # =========================
 
+    @_with_db
     def cancel_job(self, job_id: str, db: Optional[Session] = None) -> bool:
         """Cancel a pending job"""
-        if db is None:
-            with get_db() as session:
-                return self._cancel_job_with_db(job_id, session)
-        else:
-            return self._cancel_job_with_db(job_id, db)
-
-    def _cancel_job_with_db(self, job_id: str, db: Session) -> bool:
-        """Internal method to cancel job with database session"""
-        db_job = get_job_db(db, job_id)
-        if not db_job:
-            return False
-
-        # Only allow cancellation of pending jobs
-        if db_job.status != JobStatusEnum.PENDING:
-            logger.warning(f"Cannot cancel job {job_id} - status is {db_job.status.value}")
-            return False
-
-        update_job_status(
-            db,
-            job_id,
-            JobStatusEnum.FAILED,
-            error_message="Job cancelled by user",
-        )
-        logger.info(f"Cancelled job {job_id}")
-        return True
+        # Single conditional UPDATE: atomic, so a job cannot start
+        # between the status check and the cancellation
+        if try_cancel_job(db, job_id):
+            logger.info(f"Cancelled job {job_id}")
+            return True
+
+        logger.warning(f"Cannot cancel job {job_id} - missing or already started")
+        return False
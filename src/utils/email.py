@@ -1,12 +1,16 @@
 import os
 import smtplib
+import threading
 from email.message import EmailMessage
+from functools import lru_cache
 from typing import Optional
 from src.utils.logger import get_logger
 
 logger = get_logger("email_service")
 
+@lru_cache(maxsize=1)
 def _get_smtp_config():
+    """SMTP settings from the environment, read once per process"""
     return {
         "host": os.getenv("SMTP_HOST"),
         "port": int(os.getenv("SMTP_PORT", "587")),
@@ -16,6 +20,50 @@ def _get_smtp_config():
         "use_tls": os.getenv("SMTP_TLS", "true").lower() not in ["false", "0", "no"]
     }
 
+class _SMTPPool:
+    """Single pooled SMTP connection, reused across sends.
+
+    Opening a socket + STARTTLS + login per email serializes bulk sends
+    on TLS handshake latency; keeping one authenticated connection and
+    reconnecting lazily when the server drops it amortizes that cost.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._smtp: Optional[smtplib.SMTP] = None
+
+    def _connect(self, cfg) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(cfg["host"], cfg["port"])
+        if cfg["use_tls"]:
+            smtp.starttls()
+        if cfg["user"] and cfg["password"]:
+            smtp.login(cfg["user"], cfg["password"])
+        return smtp
+
+    def send(self, msg: EmailMessage) -> None:
+        cfg = _get_smtp_config()
+        with self._lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.noop()
+                except (smtplib.SMTPException, OSError):
+                    try:
+                        self._smtp.close()
+                    except Exception:
+                        pass
+                    self._smtp = None
+            if self._smtp is None:
+                self._smtp = self._connect(cfg)
+            try:
+                self._smtp.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # Server dropped us between noop and send; one retry on
+                # a fresh connection
+                self._smtp = self._connect(cfg)
+                self._smtp.send_message(msg)
+
+_pool = _SMTPPool()
+
 def send_access_email(to_email: str, api_key: str, access_link: str) -> bool:
     """
     MVP email sender:
@@ -45,12 +93,7 @@ def send_access_email(to_email: str, api_key: str, access_link: str) -> bool:
         msg["To"] = to_email
         msg.set_content(body)
 
-        with smtplib.SMTP(cfg["host"], cfg["port"]) as smtp:
-            if cfg["use_tls"]:
-                smtp.starttls()
-            if cfg["user"] and cfg["password"]:
-                smtp.login(cfg["user"], cfg["password"])
-            smtp.send_message(msg)
+        _pool.send(msg)
 
         logger.info(f"Access email sent to {to_email}")
         return True
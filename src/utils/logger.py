@@ -1,48 +1,78 @@
+import atexit
 import logging
+import queue
 import sys
-from pathlib import Path
-from datetime import datetime
+import threading
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from config.settings import settings
 
 class Logger:
     """Centralized logging system"""
-    
+
     _loggers = {}
-    
+    _lock = threading.Lock()
+    # Records go through one QueueHandler per process; a background
+    # QueueListener owns the real console + rotating file handlers, so
+    # request threads pay a queue put instead of disk I/O
+    _queue_handler = None
+    _listener = None
+
+    @classmethod
+    def _shared_handler(cls):
+        if cls._queue_handler is None:
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(logging.INFO)
+            console_handler.setFormatter(
+                logging.Formatter('%(levelname)s - %(name)s - %(message)s')
+            )
+
+            log_file = settings.LOGS_DIR / "app.log"
+            file_handler = RotatingFileHandler(
+                log_file, maxBytes=10 * 1024 * 1024, backupCount=5
+            )
+            file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(logging.Formatter(settings.LOG_FORMAT))
+
+            log_queue = queue.Queue(-1)
+            # respect_handler_level so the console stays INFO-only while
+            # the file keeps DEBUG
+            cls._listener = QueueListener(
+                log_queue, console_handler, file_handler,
+                respect_handler_level=True,
+            )
+            cls._listener.start()
+            atexit.register(cls._listener.stop)
+            cls._queue_handler = QueueHandler(log_queue)
+        return cls._queue_handler
+
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
         """Get or create a logger with the given name"""
-        
-        if name in cls._loggers:
-            return cls._loggers[name]
-        
-        logger = logging.getLogger(name)
-        logger.setLevel(settings.LOG_LEVEL)
-        
-        # Remove existing handlers
-        logger.handlers = []
-        
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_formatter = logging.Formatter(
-            '%(levelname)s - %(name)s - %(message)s'
-        )
-        console_handler.setFormatter(console_formatter)
-        
-        # File handler
-        log_file = settings.LOGS_DIR / f"{name}_{datetime.now().strftime('%Y%m%d')}.log"
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(settings.LOG_FORMAT)
-        file_handler.setFormatter(file_formatter)
-        
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
-        
-        cls._loggers[name] = logger
-        return logger
+
+        # Double-checked locking: the dict hit is the hot path and safe
+        # thanks to the GIL; the lock only guards first-time setup so
+        # two threads cannot attach duplicate handlers
+        logger = cls._loggers.get(name)
+        if logger is not None:
+            return logger
+
+        with cls._lock:
+            logger = cls._loggers.get(name)
+            if logger is not None:
+                return logger
+
+            logger = logging.getLogger(name)
+            logger.setLevel(settings.LOG_LEVEL)
+            logger.propagate = False
+
+            # Remove existing handlers
+            logger.handlers = []
+
+            logger.addHandler(cls._shared_handler())
+
+            cls._loggers[name] = logger
+            return logger
 
 # Convenience function
 def get_logger(name: str) -> logging.Logger:
-    return Logger.get_logger(name)
\ No newline at end of file
+    return Logger.get_logger(name)
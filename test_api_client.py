@@ -2,16 +2,22 @@
 Test client for the Data Preprocessing API
 """
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from pathlib import Path
 
 # API base URL
 BASE_URL = "http://localhost:8000"
 
+# One shared session: connection pooling + keep-alive instead of a
+# fresh TCP handshake per call
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 def test_health_check():
     """Test health check endpoint"""
     print("\n=== Testing Health Check ===")
-    response = requests.get(f"{BASE_URL}/health")
+    response = SESSION.get(f"{BASE_URL}/health")
     print(f"Status: {response.status_code}")
     print(f"Response: {json.dumps(response.json(), indent=2)}")
 
@@ -22,7 +28,7 @@ def test_upload_csv(file_path: str, client_id: str = "test_client"):
     with open(file_path, 'rb') as f:
         files = {'file': f}
         data = {'client_id': client_id}
-        response = requests.post(
+        response = SESSION.post(
             f"{BASE_URL}/upload/tabular",
             files=files,
             data=data
@@ -47,7 +53,7 @@ def test_create_and_execute_job(input_path: str, client_id: str = "test_client")
     }
     
     # Create job
-    response = requests.post(f"{BASE_URL}/jobs/create", params=params)
+    response = SESSION.post(f"{BASE_URL}/jobs/create", params=params)
     print(f"Create Job Status: {response.status_code}")
     job_data = response.json()
     print(f"Job Created: {json.dumps(job_data, indent=2)}")
@@ -56,7 +62,7 @@ def test_create_and_execute_job(input_path: str, client_id: str = "test_client")
     
     # Execute job
     print(f"\nExecuting job {job_id}...")
-    response = requests.post(f"{BASE_URL}/jobs/{job_id}/execute")
+    response = SESSION.post(f"{BASE_URL}/jobs/{job_id}/execute")
     print(f"Execute Status: {response.status_code}")
     print(f"Result: {json.dumps(response.json(), indent=2)}")
     
@@ -65,14 +71,14 @@ def test_create_and_execute_job(input_path: str, client_id: str = "test_client")
 def test_get_job_status(job_id: str):
     """Test getting job status"""
     print(f"\n=== Testing Get Job Status ===")
-    response = requests.get(f"{BASE_URL}/jobs/{job_id}/status")
+    response = SESSION.get(f"{BASE_URL}/jobs/{job_id}/status")
     print(f"Status: {response.status_code}")
     print(f"Response: {json.dumps(response.json(), indent=2)}")
 
 def test_list_jobs(client_id: str = "test_client"):
     """Test listing jobs"""
     print("\n=== Testing List Jobs ===")
-    response = requests.get(f"{BASE_URL}/jobs/", params={'client_id': client_id})
+    response = SESSION.get(f"{BASE_URL}/jobs/", params={'client_id': client_id})
     print(f"Status: {response.status_code}")
     jobs = response.json()
     print(f"Found {len(jobs)} jobs")
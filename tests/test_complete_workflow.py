@@ -2,9 +2,11 @@
 """
 Complete workflow test - tests the entire system end-to-end
 """
+import io
 import sys
 from pathlib import Path
 import csv
+import shutil
 import requests
 import time
 
@@ -14,10 +16,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 BASE_URL = "http://localhost:8000"
 
 def create_test_csv():
-    """Create a test CSV file with messy data"""
-    test_file = Path("tests/test_data.csv")
-    test_file.parent.mkdir(exist_ok=True)
-    
+    """Build a test CSV with messy data, in memory"""
     data = [
         ["Name", "Age", "Salary", "Department"],
         ["John Doe", "30", "50000", "Engineering"],
@@ -29,36 +28,34 @@ def create_test_csv():
         ["", "32", "58000", "Sales"],  # Missing name
     ]
     
-    with open(test_file, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerows(data)
-    
-    print(f"✅ Created test CSV: {test_file}")
-    return str(test_file)
+    # No disk round-trip: the bytes go straight to the upload request
+    buf = io.StringIO(newline='')
+    writer = csv.writer(buf)
+    writer.writerows(data)
 
-def test_workflow(api_key: str):
+    csv_bytes = buf.getvalue().encode()
+    print(f"✅ Created test CSV in memory ({len(csv_bytes)} bytes)")
+    return csv_bytes
+
+def test_workflow(session: requests.Session):
     """Test complete workflow"""
     print("\n" + "="*60)
     print("  COMPLETE WORKFLOW TEST")
     print("="*60 + "\n")
-    
-    headers = {"X-API-Key": api_key}
-    
+
     # Step 1: Create test data
     print("📝 Step 1: Creating test data...")
-    test_file = create_test_csv()
+    csv_bytes = create_test_csv()
     print()
-    
+
     # Step 2: Upload file
     print("📤 Step 2: Uploading file...")
-    with open(test_file, 'rb') as f:
-        files = {'file': f}
-        response = requests.post(
-            f"{BASE_URL}/upload/tabular",
-            files=files,
-            headers=headers
-        )
-    
+    files = {'file': ('test_data.csv', csv_bytes, 'text/csv')}
+    response = session.post(
+        f"{BASE_URL}/upload/tabular",
+        files=files
+    )
+
     if response.status_code != 200:
         print(f"❌ Upload failed: {response.text}")
         return False
@@ -79,10 +76,9 @@ def test_workflow(api_key: str):
         'auto_execute': False
     }
     
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/jobs/create",
-        params=params,
-        headers=headers
+        params=params
     )
     
     if response.status_code != 200:
@@ -95,9 +91,8 @@ def test_workflow(api_key: str):
     
     # Step 4: Test job cancellation (before executing)
     print("🛑 Step 4: Testing job cancellation...")
-    cancel_response = requests.post(
-        f"{BASE_URL}/jobs/{job_id}/cancel",
-        headers=headers
+    cancel_response = session.post(
+        f"{BASE_URL}/jobs/{job_id}/cancel"
     )
     
     if cancel_response.status_code == 200:
@@ -108,10 +103,9 @@ def test_workflow(api_key: str):
         
         # Create a new job for execution since we cancelled the first one
         print("⚙️  Creating new job for execution...")
-        response = requests.post(
+        response = session.post(
             f"{BASE_URL}/jobs/create",
-            params=params,
-            headers=headers
+            params=params
         )
         if response.status_code != 200:
             print(f"❌ Job creation failed: {response.text}")
@@ -124,9 +118,8 @@ def test_workflow(api_key: str):
     
     # Step 5: Execute job
     print("🚀 Step 5: Executing job...")
-    response = requests.post(
-        f"{BASE_URL}/jobs/{job_id}/execute",
-        headers=headers
+    response = session.post(
+        f"{BASE_URL}/jobs/{job_id}/execute"
     )
     
     if response.status_code != 200:
@@ -152,7 +145,7 @@ def test_workflow(api_key: str):
     
     # Step 7: List jobs
     print("📋 Step 7: Listing jobs...")
-    response = requests.get(f"{BASE_URL}/jobs/", headers=headers)
+    response = session.get(f"{BASE_URL}/jobs/")
     
     if response.status_code != 200:
         print(f"❌ Failed to list jobs: {response.text}")
@@ -166,21 +159,22 @@ def test_workflow(api_key: str):
     
     # Step 8: Download result
     print("💾 Step 8: Downloading processed file...")
-    response = requests.get(
-        f"{BASE_URL}/jobs/{job_id}/download",
-        headers=headers
-    )
-    
-    if response.status_code != 200:
-        print(f"❌ Download failed: {response.text}")
-        return False
-    
     output_file = Path("tests/processed_output.csv")
-    with open(output_file, 'wb') as f:
-        f.write(response.content)
-    
+    # Stream straight to disk so the download stays constant-memory
+    # regardless of output size
+    with session.get(
+        f"{BASE_URL}/jobs/{job_id}/download",
+        stream=True
+    ) as response:
+        if response.status_code != 200:
+            print(f"❌ Download failed: {response.text}")
+            return False
+
+        with open(output_file, 'wb') as f:
+            shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+
     print(f"✅ File downloaded: {output_file}")
-    print(f"   Size: {len(response.content)} bytes\n")
+    print(f"   Size: {output_file.stat().st_size} bytes\n")
     
     print("="*60)
     print("  ✅ ALL TESTS PASSED!")
@@ -197,10 +191,16 @@ def main():
         sys.exit(1)
     
     api_key = sys.argv[1]
-    
+
+    # One session for every step: keep-alive reuses the TCP connection
+    # instead of a new handshake per request
+    session = requests.Session()
+    # Auth header set once; every request through the session carries it
+    session.headers.update({"X-API-Key": api_key})
+
     # Check if server is running
     try:
-        response = requests.get(f"{BASE_URL}/health")
+        response = session.get(f"{BASE_URL}/health")
         if response.status_code != 200:
             print("❌ API server is not responding correctly")
             sys.exit(1)
@@ -208,9 +208,9 @@ def main():
         print("❌ Cannot connect to API server")
         print("   Make sure the server is running: python start.py")
         sys.exit(1)
-    
+
     # Run tests
-    success = test_workflow(api_key)
+    success = test_workflow(session)
     
     if not success:
         sys.exit(1)